@@ -13,23 +13,28 @@ def _get_version() -> str:
         Version string in CalVer format (YYYY.MM.DD[.MICRO]).
     """
     version_file = Path(__file__).parent.parent.parent / "VERSION"
-    if version_file.exists():
+    try:
         return version_file.read_text().strip()
-    return "0.0.0"  # Fallback if VERSION file missing
+    except FileNotFoundError:
+        return "0.0.0"  # Fallback if VERSION file missing
 
 
 __version__ = _get_version()
 
 # Export main classes/functions for convenient imports
+from .env import load_config_from_env  # noqa: E402
 from .ssh_enabler import (  # noqa: E402
     SSHEnabler,
-    load_config_from_env,
+    check_ssh_banner,
+    poll_ssh_port,
     verify_ssh_port,
 )
 
 __all__ = [
     "__version__",
     "SSHEnabler",
+    "check_ssh_banner",
     "load_config_from_env",
+    "poll_ssh_port",
     "verify_ssh_port",
 ]
@@ -4,16 +4,16 @@ This module provides the CLI entry point for enabling SSH on Binardat switches.
 """
 
 import argparse
+import functools
 import signal
 import sys
-import time
 
 from binardat_switch_config import __version__
-from binardat_switch_config.ssh_enabler import (
-    SSHEnabler,
-    load_config_from_env,
-    verify_ssh_port,
-)
+from binardat_switch_config.env import load_config_from_env
+from binardat_switch_config.ssh_enabler import SSHEnabler, poll_ssh_port
+
+# Separator line for section headers in console output
+_BANNER = "=" * 60
 
 # Global flag for graceful shutdown
 shutdown_requested = False
@@ -22,22 +22,33 @@ shutdown_requested = False
 def signal_handler(signum: int, frame: object) -> None:
     """Handle shutdown signals gracefully.
 
+    The first signal raises SystemExit, which unwinds through run() so the
+    browser session (local or remote) is closed on the way out. The default
+    disposition is restored first, so a second signal terminates the
+    process immediately.
+
     Args:
         signum: Signal number.
         frame: Current stack frame.
     """
     global shutdown_requested
+    signal.signal(signum, signal.SIG_DFL)
     print(f"\nReceived signal {signum}, shutting down gracefully...")
+    print("(send the signal again to exit immediately)")
     shutdown_requested = True
     sys.exit(0)
 
 
-def main() -> int:
-    """Main entry point for the CLI."""
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+@functools.lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    The parser is built once per process and reused, so argument defaults
+    reflect the environment variables at the time of the first call.
 
+    Returns:
+        The configured argument parser.
+    """
     # Load configuration from environment variables
     env_config = load_config_from_env()
 
@@ -74,12 +85,16 @@ Examples:
   # Disable SSH with custom IP
   binardat-config --disable --switch-ip 192.168.2.100
 
+  # Use a browser on a running Selenium server instead of local Chrome
+  binardat-config --remote-url http://localhost:4444/wd/hub
+
 Environment Variables:
-  SWITCH_IP         - Switch IP address (default: 192.168.2.1)
-  SWITCH_USERNAME   - Login username (default: admin)
-  SWITCH_PASSWORD   - Login password (default: admin)
-  SWITCH_SSH_PORT   - SSH port number (default: 22)
-  TIMEOUT           - Timeout in seconds (default: 10)
+  SWITCH_IP           - Switch IP address (default: 192.168.2.1)
+  SWITCH_USERNAME     - Login username (default: admin)
+  SWITCH_PASSWORD     - Login password (default: admin)
+  SWITCH_SSH_PORT     - SSH port number (default: 22)
+  TIMEOUT             - Timeout in seconds (default: 10)
+  SELENIUM_REMOTE_URL - Selenium server URL (default: launch local Chrome)
         """,
     )
 
@@ -134,32 +149,57 @@ Environment Variables:
             f"(default from env: {env_config['timeout']})"
         ),
     )
+    parser.add_argument(
+        "--remote-url",
+        default=env_config["remote_url"],
+        help=(
+            f"Selenium server URL to run the browser on "
+            f"(default from env: {env_config['remote_url'] or 'local Chrome'})"
+        ),
+    )
     parser.add_argument(
         "--no-verify", action="store_true", help="Skip SSH port verification"
     )
 
-    args = parser.parse_args()
+    return parser
 
-    # Create enabler instance
-    enabler = SSHEnabler(headless=not args.show_browser, timeout=args.timeout)
 
-    # Enable or disable SSH based on flag
-    if args.disable:
-        success = enabler.disable_ssh(
-            switch_ip=args.switch_ip,
-            username=args.username,
-            password=args.password,
-            port=args.port,
-        )
-        action = "disablement"
-    else:
-        success = enabler.enable_ssh(
-            switch_ip=args.switch_ip,
-            username=args.username,
-            password=args.password,
-            port=args.port,
-        )
-        action = "enablement"
+def run(args: argparse.Namespace) -> int:
+    """Enable or disable SSH on a switch and verify the result.
+
+    This performs the CLI's work without parsing arguments or installing
+    signal handlers, so scripts can call it repeatedly in one process.
+
+    Args:
+        args: Parsed arguments, as returned by build_parser().parse_args().
+
+    Returns:
+        Process exit code: 0 on success, 1 on failure.
+    """
+    # The with block closes the browser (local or remote) however the
+    # operation ends, including SystemExit raised by signal_handler
+    with SSHEnabler(
+        headless=not args.show_browser,
+        timeout=args.timeout,
+        remote_url=args.remote_url,
+    ) as enabler:
+        # Enable or disable SSH based on flag
+        if args.disable:
+            success = enabler.disable_ssh(
+                switch_ip=args.switch_ip,
+                username=args.username,
+                password=args.password,
+                port=args.port,
+            )
+            action = "disablement"
+        else:
+            success = enabler.enable_ssh(
+                switch_ip=args.switch_ip,
+                username=args.username,
+                password=args.password,
+                port=args.port,
+            )
+            action = "enablement"
 
     if not success:
         print(f"\n✗ SSH {action} failed")
@@ -167,14 +207,13 @@ Environment Variables:
 
     # Verify SSH port accessibility unless disabled or we're disabling SSH
     if not args.no_verify and not args.disable:
-        print(f"\n{'='*60}")
+        print(f"\n{_BANNER}")
         print(f"Verifying SSH port {args.port} accessibility...")
-        print(f"{'='*60}\n")
+        print(f"{_BANNER}\n")
 
-        print("Waiting for SSH service to start (5 seconds)...")
-        time.sleep(5)
+        print("Waiting for SSH service to start...")
 
-        if verify_ssh_port(args.switch_ip, args.port):
+        if poll_ssh_port(args.switch_ip, args.port, expect_open=True):
             print(f"✓ SSH port {args.port} is accessible")
             print("\nYou can now connect via SSH:")
             print(f"  ssh {args.username}@{args.switch_ip}")
@@ -189,14 +228,13 @@ Environment Variables:
             print("  2. Verify SSH is enabled in web interface")
             print("  3. Check switch firewall settings")
     elif args.disable and not args.no_verify:
-        print(f"\n{'='*60}")
+        print(f"\n{_BANNER}")
         print(f"Verifying SSH port {args.port} is closed...")
-        print(f"{'='*60}\n")
+        print(f"{_BANNER}\n")
 
-        print("Waiting for SSH service to stop (5 seconds)...")
-        time.sleep(5)
+        print("Waiting for SSH service to stop...")
 
-        if not verify_ssh_port(args.switch_ip, args.port):
+        if poll_ssh_port(args.switch_ip, args.port, expect_open=False):
             print(f"✓ SSH port {args.port} is no longer accessible")
             print("\nSSH has been successfully disabled")
         else:
@@ -210,15 +248,25 @@ Environment Variables:
     else:
         print("\nSkipping verification (--no-verify)")
 
-    print(f"\n{'='*60}")
+    print(f"\n{_BANNER}")
     operation = "DISABLEMENT" if args.disable else "ENABLEMENT"
     print(f"SSH {operation} COMPLETED")
     print(f"Switch: {args.switch_ip}")
     print(f"Port: {args.port}")
-    print(f"{'='*60}\n")
+    print(f"{_BANNER}\n")
 
     return 0
 
 
+def main() -> int:
+    """Main entry point for the CLI."""
+    # Register signal handlers for graceful shutdown
+    signal.signal(signal.SIGTERM, signal_handler)
+    signal.signal(signal.SIGINT, signal_handler)
+
+    args = build_parser().parse_args()
+    return run(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
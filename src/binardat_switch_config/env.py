@@ -0,0 +1,34 @@
+"""Environment variable configuration for Binardat switch tools.
+
+This module reads runtime settings from environment variables. It has no
+third-party dependencies so the CLI can build its argument parser without
+importing Selenium.
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Config key -> (environment variable, default value, type conversion).
+# A None default means the setting is unset unless the variable is present.
+_ENV_MAP: Dict[str, Tuple[str, Optional[str], Callable[[str], Any]]] = {
+    "switch_ip": ("SWITCH_IP", "192.168.2.1", str),
+    "username": ("SWITCH_USERNAME", "admin", str),
+    "password": ("SWITCH_PASSWORD", "admin", str),
+    "port": ("SWITCH_SSH_PORT", "22", int),
+    "timeout": ("TIMEOUT", "10", int),
+    "remote_url": ("SELENIUM_REMOTE_URL", None, str),
+}
+
+
+def load_config_from_env() -> Dict[str, Any]:
+    """Load configuration from environment variables.
+
+    Returns:
+        Dictionary with configuration values from environment.
+    """
+    environ = os.environ
+    config: Dict[str, Any] = {}
+    for key, (name, default, cast) in _ENV_MAP.items():
+        value = environ.get(name, default)
+        config[key] = None if value is None else cast(value)
+    return config
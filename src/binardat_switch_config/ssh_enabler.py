@@ -7,30 +7,105 @@ switches through automated web interface interaction using Selenium.
 import os
 import socket
 import time
-from typing import Any, Dict, Optional
+from types import TracebackType
+from typing import TYPE_CHECKING, Optional, Type
+
+# Re-exported for backwards compatibility; lives in a Selenium-free module
+from .env import load_config_from_env
+
+# Selenium is imported inside the SSHEnabler methods that use it, so
+# importing this module (e.g. for ``binardat-config --version``) does not
+# pull in the WebDriver stack
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+__all__ = [
+    "SSHEnabler",
+    "check_ssh_banner",
+    "load_config_from_env",
+    "poll_ssh_port",
+    "verify_ssh_port",
+]
+
+# Separator line for section headers in console output
+_BANNER = "=" * 60
+
+# Every SSH server identification string starts with this (RFC 4253)
+_SSH_BANNER_PREFIX = b"SSH-"
+
+# Field name patterns for the SSH enable checkbox/select, in priority order
+_ENABLE_FIELD_SELECTORS = (
+    'input[name="enable"]',
+    'input[name="ssh_enable"]',
+    'input[name="status"]',
+    'select[name="enable"]',
+    'select[name="ssh_enable"]',
+    'select[name="status"]',
+    'input[id*="enable"]',
+    'select[id*="enable"]',
+)
+
+# Finds the first field matching the selectors (in priority order) and,
+# if it is a checkbox in the wrong state, toggles it. Clicking the label
+# like a user would fires the checkbox's onChange handler, which posts the
+# change itself. Returns a description of the field, or null if none match.
+_PREPARE_ENABLE_FIELD_JS = """
+const [selectors, enable] = arguments;
+for (const selector of selectors) {
+    const field = document.querySelector(selector);
+    if (!field) {
+        continue;
+    }
+    const result = {
+        field: field,
+        selector: selector,
+        tag: field.tagName.toLowerCase(),
+        type: field.type || "",
+        name: field.name || "",
+        toggled: null,
+    };
+    if (result.tag === "input" && field.type === "checkbox"
+            && field.checked !== enable) {
+        const label = field.id
+            ? document.querySelector(`label[for="${field.id}"]`)
+            : null;
+        (label || field).click();
+        result.toggled = label ? "label" : "checkbox";
+    }
+    return result;
+}
+return null;
+"""
 
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select, WebDriverWait
+# The SSH page's onChange handler waits up to this many seconds for
+# ssh_post.cgi before reloading the page with reCurrentWeb()
+_TOGGLE_RELOAD_TIMEOUT = 60
 
+# Fills in the login form and submits it via the page's own handler
+_LOGIN_JS = """
+document.getElementById("name").value = arguments[0];
+document.getElementById("pwd").value = arguments[1];
+loginSubmit();
+"""
 
-def load_config_from_env() -> Dict[str, Any]:
-    """Load configuration from environment variables.
+# Counts rendered links (offsetParent is null for hidden elements)
+_COUNT_VISIBLE_LINKS_JS = """
+return Array.from(document.querySelectorAll("a")).filter(
+    (link) => link.offsetParent !== null
+).length;
+"""
 
-    Returns:
-        Dictionary with configuration values from environment.
-    """
-    return {
-        "switch_ip": os.getenv("SWITCH_IP", "192.168.2.1"),
-        "username": os.getenv("SWITCH_USERNAME", "admin"),
-        "password": os.getenv("SWITCH_PASSWORD", "admin"),
-        "port": int(os.getenv("SWITCH_SSH_PORT", "22")),
-        "timeout": int(os.getenv("TIMEOUT", "10")),
-    }
+# Describes every input, then every select, on the page in one round-trip
+_DESCRIBE_FIELDS_JS = """
+return [
+    ...document.querySelectorAll("input"),
+    ...document.querySelectorAll("select"),
+].map((field) => ({
+    name: field.getAttribute("name") || "no-name",
+    id: field.getAttribute("id") || "no-id",
+    type: field.getAttribute("type") || field.tagName.toLowerCase(),
+}));
+"""
 
 
 def verify_ssh_port(host: str, port: int = 22, timeout: float = 5.0) -> bool:
@@ -55,29 +130,129 @@ def verify_ssh_port(host: str, port: int = 22, timeout: float = 5.0) -> bool:
         return False
 
 
+def check_ssh_banner(host: str, port: int = 22, timeout: float = 5.0) -> bool:
+    """Check that an SSH server is answering on the port.
+
+    A listening socket alone can be a false positive on slow switches,
+    where the daemon binds the port before it is ready to serve. This
+    reads the identification string every SSH server sends on connect.
+
+    Args:
+        host: IP address or hostname.
+        port: SSH port number. Defaults to 22.
+        timeout: Timeout in seconds for connecting and reading.
+
+    Returns:
+        True if the server sent an SSH banner, False otherwise.
+    """
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            banner = b""
+            while len(banner) < len(_SSH_BANNER_PREFIX):
+                chunk = sock.recv(64)
+                if not chunk:
+                    break
+                banner += chunk
+            return banner.startswith(_SSH_BANNER_PREFIX)
+    except OSError:
+        return False
+
+
+def poll_ssh_port(
+    host: str,
+    port: int = 22,
+    expect_open: bool = True,
+    total_timeout: float = 30.0,
+) -> bool:
+    """Poll the SSH port until it reaches the expected state.
+
+    Probes start 0.25 seconds apart and back off exponentially (capped at
+    4 seconds), so fast switches are confirmed almost immediately while
+    slow ones still get the full timeout.
+
+    Args:
+        host: IP address or hostname.
+        port: SSH port number. Defaults to 22.
+        expect_open: True to wait for an SSH banner on the port, False to
+            wait for the port to stop accepting connections.
+        total_timeout: Maximum time to keep polling, in seconds.
+
+    Returns:
+        True if the port reached the expected state, False on timeout.
+    """
+    probe = check_ssh_banner if expect_open else verify_ssh_port
+    deadline = time.monotonic() + total_timeout
+    interval = 0.25
+    while True:
+        remaining = deadline - time.monotonic()
+        probe_timeout = max(min(remaining, 5.0), 0.1)
+        if probe(host, port, timeout=probe_timeout) == expect_open:
+            return True
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, 4.0)
+
+
 class SSHEnabler:
     """Automates SSH enablement on Binardat switches via web interface."""
 
-    def __init__(self, headless: bool = True, timeout: int = 10):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 10,
+        remote_url: Optional[str] = None,
+        reuse_session: bool = False,
+    ):
         """Initialize the SSH enabler.
 
         Args:
             headless: Run browser in headless mode (no GUI).
             timeout: Default timeout in seconds for element waits.
+            remote_url: URL of a Selenium server to run the browser on.
+                When None, a local Chrome is launched.
+            reuse_session: Keep the browser session open between
+                enable_ssh()/disable_ssh() calls instead of quitting it
+                after each one. Call close(), or use the enabler as a
+                context manager, to end it.
         """
         self.headless = headless
         self.timeout = timeout
-        self.driver: Optional[webdriver.Chrome] = None
-
-    def _setup_driver(self) -> webdriver.Chrome:
+        self.remote_url = remote_url
+        self.reuse_session = reuse_session
+        self.driver: Optional["WebDriver"] = None
+
+    def __enter__(self) -> "SSHEnabler":
+        """Return the enabler for use in a with statement."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close the browser session, however the with block exits."""
+        self.close()
+
+    def _setup_driver(self) -> "WebDriver":
         """Set up Chrome WebDriver with Docker-compatible options.
 
+        Implicit waits are disabled and page loads and scripts are bounded
+        by the configured timeout.
+
         Returns:
             Configured Chrome WebDriver instance.
 
         Raises:
             WebDriverException: If driver initialization fails.
         """
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
         options = Options()
         if self.headless:
             options.add_argument("--headless=new")
@@ -86,23 +261,72 @@ class SSHEnabler:
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
 
+        # Return from navigation at DOMContentLoaded; every step below uses
+        # explicit waits for the elements it needs
+        options.page_load_strategy = "eager"
+
         # Disable logging
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
 
+        # Skip image downloads; the admin UI is driven by element IDs only.
+        # The command-line flag also covers headless modes that ignore prefs.
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
         print("Setting up Chrome WebDriver...")
 
-        # Check if we're in Docker (CHROMEDRIVER_PATH env var set)
         chrome_driver_path = os.getenv("CHROMEDRIVER_PATH")
 
-        if chrome_driver_path and os.path.exists(chrome_driver_path):
+        driver: "WebDriver"
+        if self.remote_url:
+            print(f"Connecting to remote WebDriver at: {self.remote_url}")
+            driver = webdriver.Remote(
+                command_executor=self.remote_url, options=options
+            )
+        # Check if we're in Docker (CHROMEDRIVER_PATH env var set)
+        elif chrome_driver_path and os.path.exists(chrome_driver_path):
             # Use explicit ChromeDriver path for Docker
             print(f"Using ChromeDriver at: {chrome_driver_path}")
             service = Service(executable_path=chrome_driver_path)
-            return webdriver.Chrome(service=service, options=options)
+            driver = webdriver.Chrome(service=service, options=options)
         else:
             # Use Selenium Manager for local development
             print("Using Selenium Manager to locate ChromeDriver...")
-            return webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options)
+
+        # All element waits are explicit (WebDriverWait). A non-zero implicit
+        # wait would be added to every failed probe inside those waits.
+        driver.implicitly_wait(0)
+        driver.set_page_load_timeout(self.timeout)
+        driver.set_script_timeout(self.timeout)
+        return driver
+
+    def _release_driver(self) -> None:
+        """Close the browser, or reset it if the session is reused."""
+        if self.driver is None:
+            return
+
+        if self.reuse_session:
+            try:
+                print("Resetting browser session for reuse...")
+                self.driver.delete_all_cookies()
+                self.driver.get("about:blank")
+                return
+            except Exception as e:
+                print(f"Warning: Could not reset browser session: {e}")
+
+        print("Closing browser...")
+        self.close()
+
+    def close(self) -> None:
+        """Quit the browser session, including a reused session."""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
 
     def _login(self, host: str, username: str, password: str) -> bool:
         """Log into the switch web interface.
@@ -115,6 +339,14 @@ class SSHEnabler:
         Returns:
             True if login successful, False otherwise.
         """
+        from selenium.common.exceptions import (
+            NoSuchElementException,
+            TimeoutException,
+        )
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         assert self.driver is not None, "Driver not initialized"
         try:
             url = f"http://{host}/"
@@ -125,28 +357,18 @@ class SSHEnabler:
             wait = WebDriverWait(self.driver, self.timeout)
 
             print("Waiting for login form...")
-            name_field = wait.until(
-                EC.presence_of_element_located((By.ID, "name"))
-            )
-            pwd_field = self.driver.find_element(By.ID, "pwd")
+            wait.until(EC.presence_of_element_located((By.ID, "name")))
 
+            # Fill both fields and submit in one round-trip; this is what
+            # the login button's onclick="loginSubmit()" handler does
             print(f"Logging in as '{username}'...")
-            name_field.clear()
-            name_field.send_keys(username)
-            pwd_field.clear()
-            pwd_field.send_keys(password)
-
-            # Find and click login button
-            login_button = self.driver.find_element(
-                By.CSS_SELECTOR, "button[onclick='loginSubmit()']"
-            )
-            login_button.click()
+            self.driver.execute_script(_LOGIN_JS, username, password)
 
             # Wait for redirect to main page (index.cgi)
             print("Waiting for main page to load...")
 
             def check_main_page_loaded(
-                driver: webdriver.Chrome,
+                driver: "WebDriver",
             ) -> bool:
                 """Check if main page has loaded."""
                 return (
@@ -178,38 +400,43 @@ class SSHEnabler:
         Returns:
             True if navigation successful, False otherwise.
         """
+        from selenium.common.exceptions import (
+            NoSuchElementException,
+            TimeoutException,
+        )
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         assert self.driver is not None, "Driver not initialized"
         try:
             wait = WebDriverWait(self.driver, self.timeout)
 
             print("Looking for Monitor Management menu...")
 
-            # Wait for page to be ready
-            time.sleep(2)
-
             # The menu structure is hierarchical:
             # 1. Find and click "Monitor Management" parent menu
             # 2. Then click the submenu item with datalink="ssh_get.cgi"
 
             # Step 1: Find and click the "Monitor Management" parent menu
-            all_links = self.driver.find_elements(By.TAG_NAME, "a")
-            monitor_mgmt_parent = None
-
-            for link in all_links:
-                text = link.text.strip()
-                if text == "Monitor Management":
-                    monitor_mgmt_parent = link
-                    print("Found 'Monitor Management' parent menu")
-                    break
-
-            if monitor_mgmt_parent is None:
+            try:
+                monitor_mgmt_parent = wait.until(
+                    EC.element_to_be_clickable(
+                        (
+                            By.XPATH,
+                            "//a[normalize-space()='Monitor Management']",
+                        )
+                    )
+                )
+                print("Found 'Monitor Management' parent menu")
+            except TimeoutException:
                 print("✗ Could not find 'Monitor Management' parent menu")
                 return False
 
-            # Click the parent menu to expand submenu
+            # Click the parent menu to expand submenu; the wait below
+            # returns as soon as the submenu item becomes clickable
             print("Clicking 'Monitor Management' to expand submenu...")
             monitor_mgmt_parent.click()
-            time.sleep(1)  # Wait for submenu to expand
 
             # Step 2: Find and click the SSH Config link
             print("Looking for SSH Config submenu item...")
@@ -224,36 +451,46 @@ class SSHEnabler:
                 print("Found SSH Config link (ssh_get.cgi)")
             except TimeoutException:
                 print("✗ Could not find link with datalink='ssh_get.cgi'")
-                visible_links = [
-                    link
-                    for link in self.driver.find_elements(By.TAG_NAME, "a")
-                    if link.is_displayed()
-                ]
+                visible_links = self.driver.execute_script(
+                    _COUNT_VISIBLE_LINKS_JS
+                )
                 print(
-                    f"Found {len(visible_links)} visible links "
-                    "after expanding menu"
+                    f"Found {visible_links} visible links after expanding menu"
                 )
                 return False
 
+            # The SSH page is loaded into #appMainInner via AJAX; keep a
+            # handle on the current content so we can wait for it to be
+            # replaced before looking for the enable field
+            old_content = self.driver.find_elements(
+                By.CSS_SELECTOR, "#appMainInner > *"
+            )
+
             print("Clicking SSH Config submenu item...")
             ssh_link.click()
 
             # Wait for the SSH config form to load
             print("Waiting for SSH configuration form to load...")
-            time.sleep(2)  # Give the page time to load via AJAX
+            try:
+                if old_content:
+                    wait.until(EC.staleness_of(old_content[0]))
+            except TimeoutException:
+                # Only a hint that the form has loaded; the presence wait
+                # below is what confirms it
+                print("Note: previous page content was not replaced")
 
-            # Verify form loaded successfully
             try:
                 wait.until(
                     EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "#appMainInner")
+                        (By.CSS_SELECTOR, ", ".join(_ENABLE_FIELD_SELECTORS))
                     )
                 )
-                print("✓ Navigated to SSH configuration page")
-                return True
             except TimeoutException:
-                print("✗ Could not load SSH configuration form")
-                return False
+                # Let _set_ssh_state inspect whatever form did load
+                print("Note: SSH enable field not detected on loaded page")
+
+            print("✓ Navigated to SSH configuration page")
+            return True
 
         except TimeoutException:
             print("✗ Navigation failed: Timeout")
@@ -278,95 +515,64 @@ class SSHEnabler:
         Returns:
             True if form submitted successfully, False otherwise.
         """
+        from selenium.common.exceptions import (
+            NoSuchElementException,
+            StaleElementReferenceException,
+            TimeoutException,
+        )
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import Select, WebDriverWait
+
         assert self.driver is not None, "Driver not initialized"
         try:
             print("Looking for SSH enable form fields...")
 
-            # Try multiple field name patterns for enable checkbox/select
-            enable_selectors = [
-                'input[name="enable"]',
-                'input[name="ssh_enable"]',
-                'input[name="status"]',
-                'select[name="enable"]',
-                'select[name="ssh_enable"]',
-                'select[name="status"]',
-                'input[id*="enable"]',
-                'select[id*="enable"]',
-            ]
-
-            enable_field = None
-            for selector in enable_selectors:
-                try:
-                    enable_field = self.driver.find_element(
-                        By.CSS_SELECTOR, selector
-                    )
-                    print(f"Found enable field with selector: {selector}")
-                    break
-                except NoSuchElementException:
-                    continue
+            # Try multiple field name patterns for enable checkbox/select;
+            # a checkbox is also toggled within the same round-trip
+            found = self.driver.execute_script(
+                _PREPARE_ENABLE_FIELD_JS, list(_ENABLE_FIELD_SELECTORS), enable
+            )
 
-            if enable_field is None:
+            if found is None:
                 # Fallback: find all input and select fields for debugging
                 print(
                     "Could not find enable field automatically. "
                     "Inspecting form..."
                 )
-                inputs = self.driver.find_elements(By.TAG_NAME, "input")
-                inputs.extend(self.driver.find_elements(By.TAG_NAME, "select"))
-                print(f"Found {len(inputs)} input/select fields:")
-                for inp in inputs:
-                    name = inp.get_attribute("name") or "no-name"
-                    id_attr = inp.get_attribute("id") or "no-id"
-                    input_type = inp.get_attribute("type") or inp.tag_name
+                fields = self.driver.execute_script(_DESCRIBE_FIELDS_JS)
+                print(f"Found {len(fields)} input/select fields:")
+                for field in fields:
                     print(
-                        f"  - name='{name}', id='{id_attr}', "
-                        f"type='{input_type}'"
+                        f"  - name='{field['name']}', id='{field['id']}', "
+                        f"type='{field['type']}'"
                     )
                 return False
 
+            enable_field = found["field"]
+            field_tag = found["tag"]
+            field_type = found["type"]
+            print(f"Found enable field with selector: {found['selector']}")
+
             # Set SSH state based on field type
-            if (
-                enable_field.tag_name == "input"
-                and enable_field.get_attribute("type") == "checkbox"
-            ):
+            if field_tag == "input" and field_type == "checkbox":
                 print("Found checkbox for SSH state")
-                is_currently_enabled = enable_field.is_selected()
 
-                # Only toggle if current state doesn't match desired state
-                if is_currently_enabled != enable:
+                # The script only toggles if the current state doesn't
+                # match the desired state
+                if found["toggled"]:
                     action = "Enabling" if enable else "Disabling"
-                    print(f"{action} SSH (toggling checkbox)...")
-                    checkbox_id = enable_field.get_attribute("id")
-                    if checkbox_id:
-                        # Try to find and click the label for this checkbox
-                        try:
-                            label = self.driver.find_element(
-                                By.CSS_SELECTOR, f'label[for="{checkbox_id}"]'
-                            )
-                            print(
-                                f"Clicking label for checkbox "
-                                f"(id={checkbox_id})"
-                            )
-                            label.click()
-                        except NoSuchElementException:
-                            # Fallback: use JavaScript to click checkbox
-                            print("Using JavaScript to toggle checkbox")
-                            self.driver.execute_script(
-                                "arguments[0].click();", enable_field
-                            )
-                    else:
-                        # No ID, use JavaScript to click
-                        print("Using JavaScript to toggle checkbox")
-                        self.driver.execute_script(
-                            "arguments[0].click();", enable_field
-                        )
+                    print(
+                        f"{action} SSH (toggled checkbox via "
+                        f"{found['toggled']} click)..."
+                    )
                 else:
                     state = "enabled" if enable else "disabled"
                     print(
                         f"SSH already {state} "
                         "(checkbox state matches desired state)"
                     )
-            elif enable_field.tag_name == "select":
+            elif field_tag == "select":
                 print("Found dropdown for SSH state")
                 select = Select(enable_field)
                 if enable:
@@ -406,13 +612,10 @@ class SSHEnabler:
                                     "Warning: Could not select disable option"
                                 )
                                 return False
-            elif (
-                enable_field.tag_name == "input"
-                and enable_field.get_attribute("type") == "radio"
-            ):
+            elif field_tag == "input" and field_type == "radio":
                 print("Found radio button for SSH state")
                 # Find all radio buttons with the same name
-                radio_name = enable_field.get_attribute("name")
+                radio_name = found["name"]
                 all_radios = self.driver.find_elements(
                     By.CSS_SELECTOR,
                     f'input[name="{radio_name}"][type="radio"]',
@@ -446,10 +649,7 @@ class SSHEnabler:
                         )
                         break
             else:
-                print(
-                    f"Warning: Unknown field type for enable: "
-                    f"{enable_field.tag_name}"
-                )
+                print(f"Warning: Unknown field type for enable: {field_tag}")
 
             # Note: The SSH checkbox has an onChange handler
             # that submits immediately. No separate submit button is
@@ -459,32 +659,51 @@ class SSHEnabler:
 
             action = "enable" if enable else "disable"
             print(f"Waiting for SSH {action} submission to complete...")
-            # The JavaScript waits up to 60 seconds then reloads page
-            # Wait for the page to potentially reload
-            time.sleep(5)
 
-            # Optional: Check if SSH config fields are now visible
-            # (indicates SSH is enabled)
-            if enable:
+            # The .ssh-args fields are only shown while SSH is enabled, so
+            # wait for them to appear (or disappear) rather than sleeping
+            # through the reload. Elements may go stale mid-reload.
+            wait = WebDriverWait(
+                self.driver,
+                self.timeout,
+                ignored_exceptions=(
+                    NoSuchElementException,
+                    StaleElementReferenceException,
+                ),
+            )
+            if found["toggled"]:
+                # The old page still shows the previous .ssh-args state, so
+                # wait for reCurrentWeb() to replace it (the POST has then
+                # completed) before checking the fields. Without the reload
+                # the change may still be in flight, so don't let the
+                # caller save over it.
                 try:
-                    # These fields appear after SSH is enabled
-                    ssh_args = self.driver.find_elements(
-                        By.CSS_SELECTOR, ".ssh-args"
+                    WebDriverWait(
+                        self.driver,
+                        max(self.timeout, _TOGGLE_RELOAD_TIMEOUT),
+                    ).until(EC.staleness_of(enable_field))
+                except TimeoutException:
+                    print(f"✗ Page did not reload after SSH {action} request")
+                    return False
+
+            ssh_args_visible = EC.visibility_of_any_elements_located(
+                (By.CSS_SELECTOR, ".ssh-args")
+            )
+            try:
+                if enable:
+                    wait.until(ssh_args_visible)
+                    print(
+                        "✓ SSH configuration fields are now visible "
+                        "(SSH enabled)"
                     )
-                    if ssh_args and any(
-                        elem.is_displayed() for elem in ssh_args
-                    ):
-                        print(
-                            "✓ SSH configuration fields are now visible "
-                            "(SSH enabled)"
-                        )
-                    else:
-                        print(
-                            "Note: SSH config fields not visible "
-                            "(may need page refresh)"
-                        )
-                except Exception:
-                    pass
+                else:
+                    wait.until_not(ssh_args_visible)
+            except TimeoutException:
+                state = "not visible" if enable else "still visible"
+                print(
+                    f"Note: SSH config fields {state} "
+                    "(may need page refresh)"
+                )
 
             print("✓ Form submitted successfully")
             return True
@@ -540,11 +759,12 @@ class SSHEnabler:
             True if SSH enablement successful, False otherwise.
         """
         try:
-            self.driver = self._setup_driver()
+            if self.driver is None:
+                self.driver = self._setup_driver()
 
-            print(f"\n{'='*60}")
+            print(f"\n{_BANNER}")
             print(f"Enabling SSH on switch: {switch_ip}")
-            print(f"{'='*60}\n")
+            print(f"{_BANNER}\n")
 
             # Step 1: Login
             if not self._login(switch_ip, username, password):
@@ -572,9 +792,7 @@ class SSHEnabler:
             return False
 
         finally:
-            if self.driver:
-                print("Closing browser...")
-                self.driver.quit()
+            self._release_driver()
 
     def disable_ssh(
         self, switch_ip: str, username: str, password: str, port: int = 22
@@ -591,11 +809,12 @@ class SSHEnabler:
             True if SSH disablement successful, False otherwise.
         """
         try:
-            self.driver = self._setup_driver()
+            if self.driver is None:
+                self.driver = self._setup_driver()
 
-            print(f"\n{'='*60}")
+            print(f"\n{_BANNER}")
             print(f"Disabling SSH on switch: {switch_ip}")
-            print(f"{'='*60}\n")
+            print(f"{_BANNER}\n")
 
             # Step 1: Login
             if not self._login(switch_ip, username, password):
@@ -623,6 +842,4 @@ class SSHEnabler:
             return False
 
         finally:
-            if self.driver:
-                print("Closing browser...")
-                self.driver.quit()
+            self._release_driver()
@@ -0,0 +1,139 @@
+"""Tests for the reusable CLI entry points."""
+
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from binardat_switch_config import cli
+from binardat_switch_config.ssh_enabler import SSHEnabler
+
+
+class FakeEnabler(SSHEnabler):
+    """SSHEnabler that records calls instead of driving a browser."""
+
+    instances: List["FakeEnabler"] = []
+    result = True
+    error: Optional[BaseException] = None
+
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = 10,
+        remote_url: Optional[str] = None,
+        reuse_session: bool = False,
+    ) -> None:
+        super().__init__(headless, timeout, remote_url, reuse_session)
+        self.calls: List[str] = []
+        FakeEnabler.instances.append(self)
+
+    def enable_ssh(
+        self, switch_ip: str, username: str, password: str, port: int = 22
+    ) -> bool:
+        return self._operate("enable")
+
+    def disable_ssh(
+        self, switch_ip: str, username: str, password: str, port: int = 22
+    ) -> bool:
+        return self._operate("disable")
+
+    def close(self) -> None:
+        self.calls.append("close")
+        super().close()
+
+    def _operate(self, name: str) -> bool:
+        self.calls.append(name)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture(autouse=True)
+def fresh_parser() -> Iterator[None]:
+    """Rebuild the cached parser around each test."""
+    cli.build_parser.cache_clear()
+    yield
+    cli.build_parser.cache_clear()
+
+
+@pytest.fixture
+def fake_enabler(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Substitute FakeEnabler for SSHEnabler in the CLI."""
+    monkeypatch.setattr(cli, "SSHEnabler", FakeEnabler)
+    yield
+    FakeEnabler.instances.clear()
+    FakeEnabler.result = True
+    FakeEnabler.error = None
+
+
+def test_build_parser_is_cached() -> None:
+    """Repeated calls return the same parser object."""
+    assert cli.build_parser() is cli.build_parser()
+
+
+def test_build_parser_uses_env_defaults(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Argument defaults come from the environment."""
+    monkeypatch.setenv("SWITCH_IP", "10.0.0.5")
+    monkeypatch.setenv("SWITCH_SSH_PORT", "2222")
+    monkeypatch.setenv("SELENIUM_REMOTE_URL", "http://grid:4444/wd/hub")
+
+    args = cli.build_parser().parse_args([])
+
+    assert args.switch_ip == "10.0.0.5"
+    assert args.port == 2222
+    assert args.remote_url == "http://grid:4444/wd/hub"
+    assert not args.disable
+
+
+@pytest.mark.usefixtures("fake_enabler")
+@pytest.mark.parametrize(
+    ("argv", "result", "expected"),
+    [
+        (["--no-verify"], True, (0, ["enable", "close"])),
+        (["--no-verify"], False, (1, ["enable", "close"])),
+        (["--no-verify", "--disable"], True, (0, ["disable", "close"])),
+        (["--no-verify", "--disable"], False, (1, ["disable", "close"])),
+    ],
+)
+def test_run_returns_exit_code_and_closes(
+    argv: List[str], result: bool, expected: Tuple[int, List[str]]
+) -> None:
+    """run() maps the outcome to an exit code and closes the browser."""
+    FakeEnabler.result = result
+
+    exit_code = cli.run(cli.build_parser().parse_args(argv))
+
+    (enabler,) = FakeEnabler.instances
+    assert (exit_code, enabler.calls) == expected
+
+
+@pytest.mark.usefixtures("fake_enabler")
+@pytest.mark.parametrize("error", [RuntimeError("boom"), SystemExit(0)])
+def test_run_closes_enabler_when_interrupted(error: BaseException) -> None:
+    """The browser is closed even if the operation raises."""
+    FakeEnabler.error = error
+
+    with pytest.raises(type(error)):
+        cli.run(cli.build_parser().parse_args(["--no-verify"]))
+
+    (enabler,) = FakeEnabler.instances
+    assert enabler.calls == ["enable", "close"]
+
+
+@pytest.mark.usefixtures("fake_enabler")
+def test_run_verifies_port_after_enabling(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without --no-verify, run() waits for the SSH port to open."""
+    polls: List[Tuple[str, int, bool]] = []
+
+    def fake_poll(host: str, port: int, expect_open: bool = True) -> bool:
+        polls.append((host, port, expect_open))
+        return True
+
+    monkeypatch.setattr(cli, "poll_ssh_port", fake_poll)
+    args = cli.build_parser().parse_args(["--switch-ip", "10.0.0.9"])
+
+    assert cli.run(args) == 0
+    assert polls == [("10.0.0.9", args.port, True)]
@@ -0,0 +1,138 @@
+"""Tests for the SSH port helpers in ssh_enabler."""
+
+import socket
+import threading
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from binardat_switch_config import ssh_enabler
+from binardat_switch_config.ssh_enabler import (
+    check_ssh_banner,
+    poll_ssh_port,
+)
+
+
+@pytest.fixture
+def listener() -> Iterator[socket.socket]:
+    """Yield a listening TCP socket on a free localhost port."""
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def closed_port() -> int:
+    """Return a localhost port with nothing listening on it."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    port: int = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+@pytest.fixture
+def fake_clock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> List[float]:
+    """Replace time.monotonic/time.sleep with a clock that sleep advances.
+
+    Returns:
+        The list of requested sleep durations, in call order.
+    """
+    now = [0.0]
+    sleeps: List[float] = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(ssh_enabler.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ssh_enabler.time, "sleep", fake_sleep)
+    return sleeps
+
+
+def test_check_ssh_banner_accepts_ssh_server(
+    listener: socket.socket,
+) -> None:
+    """A peer that sends an SSH identification string is accepted."""
+
+    def serve() -> None:
+        conn, _ = listener.accept()
+        with conn:
+            conn.sendall(b"SSH-2.0-OpenSSH_9.6\r\n")
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    port = listener.getsockname()[1]
+
+    assert check_ssh_banner("127.0.0.1", port, timeout=2.0) is True
+    thread.join(timeout=2.0)
+
+
+def test_check_ssh_banner_rejects_silent_listener(
+    listener: socket.socket,
+) -> None:
+    """A port that accepts connections but sends nothing is rejected."""
+    port = listener.getsockname()[1]
+
+    assert check_ssh_banner("127.0.0.1", port, timeout=0.2) is False
+
+
+def test_check_ssh_banner_rejects_closed_port(closed_port: int) -> None:
+    """A refused connection is reported as no SSH server."""
+    assert check_ssh_banner("127.0.0.1", closed_port, timeout=0.5) is False
+
+
+def test_poll_ssh_port_closed_port_when_expecting_closed(
+    closed_port: int,
+) -> None:
+    """A closed port satisfies expect_open=False on the first probe."""
+    assert poll_ssh_port(
+        "127.0.0.1", closed_port, expect_open=False, total_timeout=1.0
+    )
+
+
+def test_poll_ssh_port_backs_off_until_deadline(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: List[float]
+) -> None:
+    """Sleeps double up to 4s and the last one is clipped to the deadline."""
+    probes: List[Tuple[str, int, float]] = []
+
+    def never_open(host: str, port: int, timeout: float) -> bool:
+        probes.append((host, port, timeout))
+        return False
+
+    monkeypatch.setattr(ssh_enabler, "check_ssh_banner", never_open)
+
+    assert not poll_ssh_port("switch", 2222, total_timeout=10.0)
+    assert fake_clock == [0.25, 0.5, 1.0, 2.0, 4.0, 2.25]
+    assert len(probes) == 7
+    assert all(host == "switch" and port == 2222 for host, port, _ in probes)
+    # Each probe is bounded by the time left, within [0.1, 5.0] seconds
+    assert [timeout for _, _, timeout in probes] == [
+        5.0,
+        5.0,
+        5.0,
+        5.0,
+        5.0,
+        2.25,
+        0.1,
+    ]
+
+
+def test_poll_ssh_port_returns_once_state_reached(
+    monkeypatch: pytest.MonkeyPatch, fake_clock: List[float]
+) -> None:
+    """Polling stops as soon as a probe reports the expected state."""
+    results = iter([True, True, False])
+
+    def closes_on_third_probe(host: str, port: int, timeout: float) -> bool:
+        return next(results)
+
+    monkeypatch.setattr(ssh_enabler, "verify_ssh_port", closes_on_third_probe)
+
+    assert poll_ssh_port("switch", expect_open=False, total_timeout=30.0)
+    assert fake_clock == [0.25, 0.5]